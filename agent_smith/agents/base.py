@@ -4,25 +4,19 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Protocol, TypedDict
+from typing import Any, Protocol
 
 from ..logging_config import get_logger
-from ..tools.llm import BaseLLM, get_llm
+from ..tools.cache import BaseLLMCache, get_llm_cache
+from ..tools.llm import BaseLLM, Message, Prompt, get_llm, render_prompt
 
 logger = get_logger(__name__)
 
 
-class Message(TypedDict, total=False):
-    """Simple schema for chat-style LLM prompts."""
-
-    role: str
-    content: str
-
-
 class SupportsLLM(Protocol):
     """Protocol for LLM-like objects."""
 
-    def complete(self, prompt: str, **kwargs: Any) -> str:  # pragma: no cover - interface
+    def complete(self, prompt: Prompt, **kwargs: Any) -> str:  # pragma: no cover - interface
         ...
 
 
@@ -38,25 +32,51 @@ class AgentContext:
 class Agent(ABC):
     """Base class shared by all domain-specific agents."""
 
-    def __init__(self, name: str, system_prompt: str, llm: BaseLLM | None = None) -> None:
+    def __init__(
+        self,
+        name: str,
+        system_prompt: str,
+        llm: BaseLLM | None = None,
+        llm_cache: BaseLLMCache | None = None,
+    ) -> None:
         self.name = name
-        self.system_prompt = system_prompt
+        self.system_prompt = system_prompt.strip()
         self.llm = llm or get_llm()
+        # An explicit cache is always honoured; the shared one only for models worth caching.
+        self.llm_cache = llm_cache or (get_llm_cache() if self.llm.cache_responses else None)
 
     @abstractmethod
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """Execute the agent's primary action and return structured data."""
 
-    def build_prompt(self, user_prompt: str) -> str:
-        """Combine the system prompt with a user instruction string."""
+    def build_prompt(self, user_prompt: str) -> list[Message]:
+        """Pair the static system prompt (a cacheable prefix) with a user turn."""
+
+        return [
+            {"role": "system", "content": self.system_prompt, "cache_control": {"type": "ephemeral"}},
+            {"role": "user", "content": user_prompt.strip()},
+        ]
 
-        return f"{self.system_prompt.strip()}\n\n{user_prompt.strip()}".strip()
+    def call_llm(self, prompt: Prompt, **kwargs: Any) -> str:
+        """Send prompt to configured LLM (or serve it from cache) and capture logs.
 
-    def call_llm(self, prompt: str, **kwargs: Any) -> str:
-        """Send prompt to configured LLM and capture logs."""
+        Calls that pass extra completion options bypass the response cache.
+        """
 
         logger.info("agent_llm_call", agent=self.name)
-        return self.llm.complete(prompt, **kwargs)
+        cache = self.llm_cache if not kwargs else None
+        if cache is None:
+            return self.llm.complete(prompt, **kwargs)
+
+        cache_key = render_prompt(prompt)
+        namespace = self.llm.cache_namespace
+        cached = cache.lookup(cache_key, namespace)
+        if cached is not None:
+            logger.info("agent_llm_cache_hit", agent=self.name)
+            return cached
+        response = self.llm.complete(prompt, **kwargs)
+        cache.update(cache_key, response, namespace)
+        return response
 
 
 __all__ = ["Agent", "AgentContext", "Message"]
@@ -7,11 +7,14 @@ from typing import Iterable
 from ..models import LearningGoal, PlanItem, Resource
 from .base import Agent
 
+# Relevance by rank: 1.0 for the top hit, decaying by 0.1 to a floor of 0.1.
+_RANK_SCORES = tuple(round(1.0 - 0.1 * rank, 1) for rank in range(10))
+
 
 class CuratorAgent(Agent):
     """Evaluates fetched resources and produces a concise study brief."""
 
-    def __init__(self, llm=None) -> None:
+    def __init__(self, llm=None, llm_cache=None) -> None:
         super().__init__(
             name="curator",
             system_prompt=(
@@ -19,6 +22,7 @@ class CuratorAgent(Agent):
                 "Return highlights emphasizing why they help the learner."
             ),
             llm=llm,
+            llm_cache=llm_cache,
         )
 
     def run(
@@ -44,10 +48,10 @@ class CuratorAgent(Agent):
 
     @staticmethod
     def _score_resources(resources: Iterable[Resource]) -> list[Resource]:
-        scored: list[Resource] = []
-        for idx, resource in enumerate(resources):
-            resource.relevance_score = max(0.1, 1.0 - (idx * 0.1))
-            scored.append(resource)
+        scored = list(resources)
+        floor = _RANK_SCORES[-1]
+        for rank, resource in enumerate(scored):
+            resource.relevance_score = _RANK_SCORES[rank] if rank < len(_RANK_SCORES) else floor
         return scored
 
 
@@ -12,7 +12,7 @@ from .base import Agent
 class PlannerAgent(Agent):
     """Agent that generates short task lists for a learning day."""
 
-    def __init__(self, llm=None) -> None:
+    def __init__(self, llm=None, llm_cache=None) -> None:
         super().__init__(
             name="planner",
             system_prompt=(
@@ -20,6 +20,7 @@ class PlannerAgent(Agent):
                 "for the given learning goal, focusing on observable actions."
             ),
             llm=llm,
+            llm_cache=llm_cache,
         )
 
     def run(
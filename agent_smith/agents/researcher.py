@@ -2,39 +2,57 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Iterable
 
 from ..models import LearningGoal, PlanItem, Resource
-from ..tools.vector import upsert_resources
-from ..tools.web import SearchResult, arxiv_search, duckduckgo_search, wikipedia_search
+from ..tools.vector import upsert_resources_async
+from ..tools.web import SearchResult, arxiv_search_async, duckduckgo_search, wikipedia_search_async
 from .base import Agent
 
 
 class ResearcherAgent(Agent):
     """Turns plan items into search queries and persists curated resources."""
 
-    def __init__(self, llm=None) -> None:
+    def __init__(self, llm=None, llm_cache=None) -> None:
         super().__init__(
             name="researcher",
             system_prompt="Find practical, current resources that align with the learner's plan.",
             llm=llm,
+            llm_cache=llm_cache,
         )
 
-    def run(self, goal: LearningGoal, plan_items: Iterable[PlanItem]) -> list[Resource]:
+    async def run(self, goal: LearningGoal, plan_items: Iterable[PlanItem]) -> list[Resource]:
         if goal.id is None:
             raise ValueError("Goal must be persisted before running researcher agent")
 
+        items = list(plan_items)
+        wants_papers = [
+            any(keyword in item.task.lower() for keyword in ("paper", "theory", "research")) for item in items
+        ]
+        # Wikipedia/arXiv lookups only depend on the goal, so they run once and
+        # overlap with the per-item web searches. Those two share a pooled HTTP/2
+        # client; DuckDuckGo goes through DDGS's own client in a worker thread.
+        searches = [
+            asyncio.to_thread(duckduckgo_search, f"{goal.title} {item.task}".strip(), max_results=3)
+            for item in items
+        ]
+        searches.append(wikipedia_search_async(goal.title))
+        if any(wants_papers):
+            searches.append(arxiv_search_async(goal.title, max_results=1))
+        results: list[list[SearchResult]] = await asyncio.gather(*searches)
+        wiki_hits = results[len(items)]
+        arxiv_hits = results[len(items) + 1] if any(wants_papers) else []
+
+        seen: set[tuple[str, str]] = set()
         resources: list[Resource] = []
-        for item in plan_items:
+        for item, web_hits, papers in zip(items, results, wants_papers):
             goal_id = item.goal_id or goal.id
-            query = f"{goal.title} {item.task}".strip()
-            hits: list[SearchResult] = []
-            hits.extend(duckduckgo_search(query, max_results=3))
-            hits.extend(wikipedia_search(goal.title))
-            if any(keyword in item.task.lower() for keyword in ("paper", "theory", "research")):
-                hits.extend(arxiv_search(goal.title, max_results=1))
-
-            for hit in hits:
+            for hit in [*web_hits, *wiki_hits, *(arxiv_hits if papers else [])]:
+                key = (hit.source, hit.url)
+                if hit.url and key in seen:
+                    continue
+                seen.add(key)
                 resources.append(
                     Resource(
                         goal_id=goal_id,
@@ -47,7 +65,7 @@ class ResearcherAgent(Agent):
                     )
                 )
 
-        upsert_resources(resources)
+        await upsert_resources_async(resources)
         return resources
 
 
@@ -3,22 +3,57 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Iterable
 
 from ..models import LearningGoal, PlanItem
 from .base import Agent
 
+try:
+    import re2 as _regex  # linear-time matching on arbitrarily long LLM output
+except ImportError:  # pragma: no cover - optional dependency
+    _regex = re
+
+# One question/answer pair per line. Line breaks are the ones ``str.splitlines`` knows
+# and blanks the remaining ``str.isspace`` characters, spelled out because re2's ``\s``
+# is ASCII-only. The answer must start with a non-blank so empty keys are skipped.
+_LINE_BREAKS = "\n\r\v\f\x1c-\x1e\x85\u2028\u2029"
+_BLANKS = "\t \x1f\xa0\u1680\u2000-\u200a\u202f\u205f\u3000"
+# Flags are inline because ``re2.compile`` does not accept ``re`` flag arguments.
+_QUIZ_RE = _regex.compile(
+    f"(?i)(?:^|[{_LINE_BREAKS}])[{_BLANKS}]*(\\d+)[.)\\-]*[{_BLANKS}]*([^{_LINE_BREAKS}]+?)"
+    f"[{_BLANKS}]*Answer[:\\-][{_BLANKS}]*([^{_LINE_BREAKS}{_BLANKS}][^{_LINE_BREAKS}]*)"
+)
+
+
+def _token_set(text: str) -> frozenset[str]:
+    """Lowercased whitespace tokens."""
+
+    return frozenset(text.lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _answer_key_tokens(expected: str) -> frozenset[str]:
+    """Token set of an answer key; memoised because keys are graded repeatedly.
+
+    Learner answers are unbounded request payloads that rarely repeat, so they
+    go through :func:`_token_set` uncached.
+    """
+
+    return _token_set(expected)
+
 
 class TutorAgent(Agent):
     """Generates quiz questions and lightweight coaching snippets."""
 
-    def __init__(self, llm=None) -> None:
+    def __init__(self, llm=None, llm_cache=None) -> None:
         super().__init__(
             name="tutor",
             system_prompt=(
                 "You are a friendly coach. Create short formative questions and include the answer key."
             ),
             llm=llm,
+            llm_cache=llm_cache,
         )
 
     def run(
@@ -48,36 +83,32 @@ class TutorAgent(Agent):
 
     @staticmethod
     def _parse_questions(raw: str) -> list[dict[str, str]]:
-        entries: list[dict[str, str]] = []
-        pattern = re.compile(r"^(\d+)[\.)\-]*\s*(.+?)\s*Answer[:\-]\s*(.+)$", re.IGNORECASE)
-        for line in raw.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            match = pattern.match(line)
-            if match:
-                entries.append(
-                    {
-                        "question": match.group(2).strip(),
-                        "answer": match.group(3).strip(),
-                        "difficulty": "medium",
-                    }
-                )
-        return entries
+        return [
+            {
+                "question": match.group(2).strip(),
+                "answer": match.group(3).strip(),
+                "difficulty": "medium",
+            }
+            for match in _QUIZ_RE.finditer(raw)
+        ]
 
     @staticmethod
     def evaluate_answer(expected: str, given: str) -> tuple[bool, str]:
         """Approximate scoring by overlap heuristics."""
 
-        expected_tokens = set(expected.lower().split())
-        given_tokens = set(given.lower().split())
-        overlap = expected_tokens & given_tokens
-        score = len(overlap) / max(1, len(expected_tokens))
-        is_correct = score >= 0.4
-        feedback = (
-            "Great job!" if is_correct else f"Focus on covering: {' '.join(sorted(expected_tokens - given_tokens))[:120]}"
-        )
-        return is_correct, feedback
+        expected_tokens = _answer_key_tokens(expected)
+        given_tokens = _token_set(given)
+        score = len(expected_tokens & given_tokens) / max(1, len(expected_tokens))
+        if score >= 0.4:
+            return True, "Great job!"
+        missing = " ".join(sorted(expected_tokens - given_tokens))
+        return False, f"Focus on covering: {missing[:120]}"
+
+    @classmethod
+    def evaluate_answers(cls, pairs: Iterable[tuple[str, str]]) -> list[tuple[bool, str]]:
+        """Grade (expected, given) pairs; each distinct answer key is tokenized once."""
+
+        return [cls.evaluate_answer(expected, given) for expected, given in pairs]
 
 
 __all__ = ["TutorAgent"]
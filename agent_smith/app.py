@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections import Counter
+
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
+from .config import get_settings
 from .db import init_db
 from .models import Episode, LearningGoal, PlanItem, QuizItem
 from .orchestrator import AgentOrchestrator
+from .tools.web import close_async_http_client
 
 app = FastAPI(title='Agent Smith', version='0.1.0')
 orchestrator = AgentOrchestrator()
@@ -25,11 +29,21 @@ class AnswerRequest(BaseModel):
     answer: str
 
 
+class BatchAnswerRequest(AnswerRequest):
+    quiz_id: int
+
+
 @app.on_event('startup')
 def on_startup() -> None:
+    get_settings().ensure_directories()
     init_db()
 
 
+@app.on_event('shutdown')
+async def on_shutdown() -> None:
+    await close_async_http_client()
+
+
 @app.get('/health')
 async def health() -> dict[str, str]:
     return {'status': 'ok'}
@@ -68,7 +82,7 @@ async def get_plan(goal_id: int, day: int | None = None) -> list[PlanItem]:
 @app.post('/goals/{goal_id}/run/{day}', response_model=Episode)
 async def run_day(goal_id: int, day: int) -> Episode:
     try:
-        return orchestrator.run_day(goal_id, day)
+        return await orchestrator.run_day(goal_id, day)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -84,3 +98,15 @@ async def submit_answer(quiz_id: int, payload: AnswerRequest) -> QuizItem:
         return orchestrator.submit_quiz_answer(quiz_id, payload.answer)
     except ValueError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.post('/quiz/answers', response_model=list[QuizItem])
+async def submit_answers(payload: list[BatchAnswerRequest]) -> list[QuizItem]:
+    counts = Counter(item.quiz_id for item in payload)
+    duplicates = sorted(quiz_id for quiz_id, count in counts.items() if count > 1)
+    if duplicates:
+        raise HTTPException(status_code=422, detail=f'Duplicate quiz ids {duplicates}')
+    try:
+        return orchestrator.submit_quiz_answers({item.quiz_id: item.answer for item in payload})
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
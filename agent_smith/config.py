@@ -37,6 +37,46 @@ class Settings(BaseSettings):
         default=Path("./var/chroma"),
         description="Directory used by ChromaDB for persistent embeddings.",
     )
+    chroma_host: str | None = Field(
+        default=None,
+        description="Chroma server host; when set, the vector store is remote instead of chroma_path.",
+    )
+    chroma_port: int = Field(
+        default=8000,
+        description="Port of the Chroma server named by chroma_host.",
+    )
+    http_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse Wikipedia/arXiv responses from an on-disk cache.",
+    )
+    http_cache_path: Path = Field(
+        default=Path("./var/http_cache.db"),
+        description="SQLite file backing the HTTP response cache.",
+    )
+    http_cache_ttl: float = Field(
+        default=86400.0,
+        gt=0,
+        description="Seconds a cached HTTP response is reused before refetching.",
+    )
+    embedding_quantize: bool = Field(
+        default=False,
+        description="Round hashing embeddings to int8 precision (1/127 steps) before storing them.",
+    )
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse stored LLM responses when an agent repeats a prompt (hosted models only by default).",
+    )
+    llm_cache_ttl: float = Field(
+        default=7 * 86400.0,
+        gt=0,
+        description="Seconds a cached LLM response is reused before the model is asked again.",
+    )
+    llm_cache_similarity: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for semantic cache hits (exact matches only when unset).",
+    )
 
     @property
     def database_url(self) -> str:
@@ -44,15 +84,19 @@ class Settings(BaseSettings):
 
         return f"sqlite:///{self.sqlite_path}"
 
+    def ensure_directories(self) -> None:
+        """Create the on-disk locations for SQLite, Chroma and the HTTP cache if missing."""
+
+        self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
+        self.chroma_path.mkdir(parents=True, exist_ok=True)
+        self.http_cache_path.parent.mkdir(parents=True, exist_ok=True)
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return a cached Settings instance for app-wide reuse."""
 
-    settings = Settings()
-    settings.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
-    settings.chroma_path.mkdir(parents=True, exist_ok=True)
-    return settings
+    return Settings()
 
 
 __all__ = ["Settings", "get_settings"]
@@ -5,20 +5,53 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Iterator
 
+from sqlalchemy import event
+from sqlalchemy.orm import configure_mappers
 from sqlmodel import Session, SQLModel, create_engine
 
 from .config import get_settings
 
 settings = get_settings()
 
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-engine = create_engine(settings.database_url, echo=False, connect_args=connect_args)
+# WAL lets readers proceed alongside a writer and, with synchronous=NORMAL,
+# commits skip the fsync of the main database file.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+is_sqlite = settings.database_url.startswith("sqlite")
+connect_args = {"check_same_thread": False} if is_sqlite else {}
+engine = create_engine(
+    settings.database_url,
+    echo=False,
+    connect_args=connect_args,
+    pool_size=10,
+    pool_pre_ping=True,
+)
+
+
+if is_sqlite:
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        """Tune every new SQLite connection for concurrent API traffic."""
+
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
 
 
 def init_db() -> None:
-    """Create database tables if they do not already exist."""
+    """Create database tables and configure ORM mappers ahead of the first request."""
 
     SQLModel.metadata.create_all(engine)
+    configure_mappers()
 
 
 @contextmanager
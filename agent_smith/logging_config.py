@@ -6,11 +6,18 @@ import logging
 from logging.config import dictConfig
 from typing import Any
 
+import orjson
 import structlog
 
 from .config import get_settings
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize with orjson, decoding to ``str`` for the stdlib logging handlers."""
+
+    return orjson.dumps(obj, **kwargs).decode("utf-8")
+
+
 def setup_logging(level: str | int | None = None) -> None:
     """Configure JSON logging with structlog bound to stdlib logging."""
 
@@ -52,7 +59,7 @@ def setup_logging(level: str | int | None = None) -> None:
             timestamper,
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps, option=orjson.OPT_NON_STR_KEYS),
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.make_filtering_bound_logger(
@@ -1,14 +1,20 @@
 """SQLModel ORM definitions for Agent Smith."""
 
-from __future__ import annotations
-
-from datetime import datetime
+# No ``from __future__ import annotations`` here: SQLAlchemy cannot resolve
+# relationship annotations such as ``list["PlanItem"]`` once they are strings.
+from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Optional
 
 from sqlmodel import Field, Relationship, SQLModel
 
 
+def utcnow() -> datetime:
+    """Naive UTC timestamp, replacing the deprecated ``datetime.utcnow``."""
+
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class GoalStatus(StrEnum):
     """Lifecycle states for a learning goal."""
 
@@ -46,8 +52,8 @@ class LearningGoal(SQLModel, table=True):
     learner_profile: Optional[str] = None
     status: GoalStatus = Field(default=GoalStatus.NEW)
     target_days: Optional[int] = Field(default=None, ge=1)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
+    updated_at: datetime = Field(default_factory=utcnow, nullable=False)
 
     plan_items: list["PlanItem"] = Relationship(back_populates="goal")
     resources: list["Resource"] = Relationship(back_populates="goal")
@@ -68,8 +74,8 @@ class PlanItem(SQLModel, table=True):
     status: PlanStatus = Field(default=PlanStatus.PENDING)
     notes: Optional[str] = None
     reflection: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
+    updated_at: datetime = Field(default_factory=utcnow, nullable=False)
 
     goal: LearningGoal = Relationship(back_populates="plan_items")
     resources: list["Resource"] = Relationship(back_populates="plan_item")
@@ -90,7 +96,7 @@ class Resource(SQLModel, table=True):
     source: Optional[str] = None
     vector_id: Optional[str] = Field(default=None, index=True)
     relevance_score: Optional[float] = Field(default=None, ge=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
 
     goal: LearningGoal = Relationship(back_populates="resources")
     plan_item: Optional[PlanItem] = Relationship(back_populates="resources")
@@ -111,7 +117,7 @@ class QuizItem(SQLModel, table=True):
     is_correct: Optional[bool] = None
     feedback: Optional[str] = None
     status: QuizStatus = Field(default=QuizStatus.DRAFT)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
 
     goal: LearningGoal = Relationship(back_populates="quiz_items")
 
@@ -129,7 +135,7 @@ class Episode(SQLModel, table=True):
     curator_summary: Optional[str] = None
     tutor_summary: Optional[str] = None
     reflection: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(default_factory=utcnow, nullable=False)
 
     goal: LearningGoal = Relationship(back_populates="episodes")
 
@@ -143,4 +149,5 @@ __all__ = [
     "QuizItem",
     "QuizStatus",
     "Resource",
+    "utcnow",
 ]
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from sqlmodel import select
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Mapping
+
+from sqlmodel import case, func, select, update
 
 from .agents.curator import CuratorAgent
 from .agents.planner import PlannerAgent
@@ -19,11 +24,44 @@ from .models import (
     PlanStatus,
     QuizItem,
     QuizStatus,
+    utcnow,
 )
 
 logger = get_logger(__name__)
 
 
+class _GoalCache:
+    """Bounded TTL map of goal rows, shared by the request threads."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 10.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[float, LearningGoal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, goal_id: int) -> LearningGoal | None:
+        with self._lock:
+            entry = self._entries.get(goal_id)
+            if entry is None:
+                return None
+            expires_at, goal = entry
+            if expires_at <= time.monotonic():
+                del self._entries[goal_id]
+                return None
+            return goal
+
+    def set(self, goal: LearningGoal) -> None:
+        with self._lock:
+            self._entries[goal.id] = (time.monotonic() + self.ttl, goal)
+            self._entries.move_to_end(goal.id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, goal_id: int) -> None:
+        with self._lock:
+            self._entries.pop(goal_id, None)
+
+
 class AgentOrchestrator:
     """High-level façade used by the FastAPI layer."""
 
@@ -32,6 +70,7 @@ class AgentOrchestrator:
         self.researcher = ResearcherAgent()
         self.curator = CuratorAgent()
         self.tutor = TutorAgent()
+        self._goals = _GoalCache()
 
     # Goal helpers ---------------------------------------------------------
     def create_goal(
@@ -52,13 +91,18 @@ class AgentOrchestrator:
             session.add(goal)
             session.commit()
             session.refresh(goal)
+            self._goals.set(goal)
             return goal
 
     def get_goal(self, goal_id: int) -> LearningGoal:
+        goal = self._goals.get(goal_id)
+        if goal is not None:
+            return goal
         with get_session() as session:
             goal = session.get(LearningGoal, goal_id)
             if goal is None:
                 raise ValueError(f"Goal {goal_id} not found")
+            self._goals.set(goal)
             return goal
 
     def get_plan(self, goal_id: int, day_number: int | None = None) -> list[PlanItem]:
@@ -66,56 +110,35 @@ class AgentOrchestrator:
             statement = select(PlanItem).where(PlanItem.goal_id == goal_id).order_by(PlanItem.day_number, PlanItem.sequence)
             if day_number is not None:
                 statement = statement.where(PlanItem.day_number == day_number)
-            return list(session.exec(statement))
+            return session.exec(statement).all()
 
     # Pipeline -------------------------------------------------------------
-    def run_day(self, goal_id: int, day_number: int) -> Episode:
+    async def run_day(self, goal_id: int, day_number: int) -> Episode:
         logger.info("run_day", goal_id=goal_id, day_number=day_number)
         with get_session() as session:
-            goal = session.get(LearningGoal, goal_id)
-            if goal is None:
-                raise ValueError(f"Goal {goal_id} not found")
-
-            previous_items = list(
-                session.exec(
-                    select(PlanItem).where(PlanItem.goal_id == goal_id, PlanItem.day_number == day_number)
-                )
+            # The plan is committed before the network and LLM stages and everything
+            # else in one short transaction at the end, so no SQLite write lock is
+            # held across an await. Committed objects stay loaded for the worker
+            # threads, which therefore never touch the shared session.
+            session.expire_on_commit = False
+            goal, plan_items, planner_summary = await asyncio.to_thread(
+                self._plan_day, session, goal_id, day_number
             )
-            plan_payloads = self.planner.run(goal, day_number, previous_items=previous_items)
-            plan_items = [
-                PlanItem(
-                    goal_id=goal_id,
-                    day_number=day_number,
-                    sequence=payload["sequence"],
-                    task=str(payload["task"]),
-                    notes=str(payload.get("notes", "")),
-                    status=PlanStatus.PENDING,
-                )
-                for payload in plan_payloads
-            ]
-            session.add_all(plan_items)
-            goal.status = GoalStatus.ACTIVE
-            goal.updated_at = datetime.utcnow()
-            session.add(goal)
-            session.commit()
-            for item in plan_items:
-                session.refresh(item)
-            logger.info("planner_completed", plan_count=len(plan_items))
+            self._goals.invalidate(goal_id)  # status and updated_at changed
 
-            resources = self.researcher.run(goal, plan_items)
-            session.add_all(resources)
-            session.commit()
-            for resource in resources:
-                session.refresh(resource)
+            resources = await self.researcher.run(goal, plan_items)
             logger.info("researcher_completed", resource_count=len(resources))
 
-            curation = self.curator.run(goal, plan_items, resources)
+            curation = await asyncio.to_thread(self.curator.run, goal, plan_items, resources)
             curated_resources = curation["resources"]
-            session.add_all(curated_resources)
-            session.commit()
-            logger.info("curator_completed", summary_length=len(str(curation["summary"])))
+            curated_summary = str(curation["summary"])
+            logger.info("curator_completed", summary_length=len(curated_summary))
 
-            quiz_payloads = self.tutor.run(goal, plan_items, str(curation["summary"]))
+            # Tutor and reflection only need the curated summary, so their LLM calls overlap.
+            quiz_payloads, reflection = await asyncio.gather(
+                asyncio.to_thread(self.tutor.run, goal, plan_items, curated_summary),
+                asyncio.to_thread(self._generate_reflection, goal, plan_items, curated_summary),
+            )
             quiz_items = [
                 QuizItem(
                     goal_id=goal_id,
@@ -127,34 +150,71 @@ class AgentOrchestrator:
                 )
                 for payload in quiz_payloads
             ]
-            session.add_all(quiz_items)
-            session.commit()
-            for quiz in quiz_items:
-                session.refresh(quiz)
             logger.info("tutor_completed", quiz_count=len(quiz_items))
-
-            reflection = self._generate_reflection(goal, plan_items, str(curation["summary"]))
-            self._rewrite_future_plan_items(session, goal_id, day_number, reflection)
             logger.info("reflection_generated", excerpt=reflection[:120])
 
             episode = Episode(
                 goal_id=goal_id,
                 day_number=day_number,
-                planner_summary="\n".join(f"{item.sequence}. {item.task}" for item in plan_items),
+                planner_summary=planner_summary,
                 researcher_summary=f"Curated {len(resources)} resources",
-                curator_summary=str(curation["summary"]),
-                tutor_summary="; ".join(q.question for q in quiz_items),
+                curator_summary=curated_summary,
+                tutor_summary="; ".join(payload["question"] for payload in quiz_payloads),
                 reflection=reflection,
             )
-            session.add(episode)
-            session.commit()
-            session.refresh(episode)
+            await asyncio.to_thread(
+                self._record_day,
+                session,
+                [*resources, *curated_resources, *quiz_items, episode],
+                goal_id,
+                day_number,
+                reflection,
+            )
             return episode
 
+    def _plan_day(self, session, goal_id: int, day_number: int) -> tuple[LearningGoal, list[PlanItem], str]:
+        """Plan the day and commit the new items, which the researcher needs ids for."""
+
+        goal = session.get(LearningGoal, goal_id)
+        if goal is None:
+            raise ValueError(f"Goal {goal_id} not found")
+
+        previous_items = session.exec(
+            select(PlanItem).where(PlanItem.goal_id == goal_id, PlanItem.day_number == day_number)
+        ).all()
+        plan_payloads = self.planner.run(goal, day_number, previous_items=previous_items)
+        plan_items = [
+            PlanItem(
+                goal_id=goal_id,
+                day_number=day_number,
+                sequence=payload["sequence"],
+                task=str(payload["task"]),
+                notes=str(payload.get("notes", "")),
+                status=PlanStatus.PENDING,
+            )
+            for payload in plan_payloads
+        ]
+        # Summaries are built from the plain payloads, not instrumented ORM attributes.
+        planner_summary = "\n".join(f"{payload['sequence']}. {payload['task']}" for payload in plan_payloads)
+        session.add_all(plan_items)
+        goal.status = GoalStatus.ACTIVE
+        goal.updated_at = utcnow()
+        session.add(goal)
+        session.commit()
+        logger.info("planner_completed", plan_count=len(plan_items))
+        return goal, plan_items, planner_summary
+
+    def _record_day(self, session, rows: list, goal_id: int, day_number: int, reflection: str) -> None:
+        """Persist the day's resources, quizzes, reflection notes and episode in one transaction."""
+
+        session.add_all(rows)
+        self._rewrite_future_plan_items(session, goal_id, day_number, reflection)
+        session.commit()
+
     def get_quiz_for_day(self, goal_id: int, day_number: int) -> list[QuizItem]:
         with get_session() as session:
             statement = select(QuizItem).where(QuizItem.goal_id == goal_id, QuizItem.day_number == day_number)
-            return list(session.exec(statement))
+            return session.exec(statement).all()
 
     def submit_quiz_answer(self, quiz_id: int, answer: str) -> QuizItem:
         with get_session() as session:
@@ -171,6 +231,28 @@ class AgentOrchestrator:
             session.refresh(quiz)
             return quiz
 
+    def submit_quiz_answers(self, answers: Mapping[int, str]) -> list[QuizItem]:
+        """Grade several quiz answers in one transaction, keyed by quiz id."""
+
+        with get_session() as session:
+            statement = select(QuizItem).where(QuizItem.id.in_(answers))
+            quizzes = {quiz.id: quiz for quiz in session.exec(statement)}
+            missing = [quiz_id for quiz_id in answers if quiz_id not in quizzes]
+            if missing:
+                raise ValueError(f"Quiz items {missing} not found")
+
+            ordered = [quizzes[quiz_id] for quiz_id in answers]
+            grades = TutorAgent.evaluate_answers((quiz.answer, answers[quiz.id]) for quiz in ordered)
+            for quiz, (is_correct, feedback) in zip(ordered, grades):
+                quiz.learner_answer = answers[quiz.id]
+                quiz.is_correct = is_correct
+                quiz.feedback = feedback
+                quiz.status = QuizStatus.ANSWERED
+            session.add_all(ordered)
+            session.commit()
+            session.exec(statement).all()  # reload the expired rows in one query
+            return ordered
+
     def _generate_reflection(
         self,
         goal: LearningGoal,
@@ -196,24 +278,23 @@ class AgentOrchestrator:
         day_number: int,
         reflection: str,
     ) -> None:
-        """Append reflection hints to future plan items."""
+        """Append reflection hints to future plan items with a single UPDATE."""
 
-        future_items = list(
-            session.exec(
-                select(PlanItem).where(PlanItem.goal_id == goal_id, PlanItem.day_number > day_number)
-            )
-        )
-        if not future_items or not reflection:
+        if not reflection:
             return
 
         first_sentence = reflection.split(".")[0].strip()
-        for item in future_items:
-            if first_sentence:
-                item.task = f"{item.task} (Focus: {first_sentence[:60]})"
-            note = f"Reflection applied on day {day_number}: {reflection[:200]}"
-            item.notes = f"{(item.notes or '').strip()}\n{note}".strip()
-            session.add(item)
-        session.commit()
+        # Stripped like the combined notes used to be, so no trailing whitespace is stored.
+        note = f"Reflection applied on day {day_number}: {reflection[:200]}".rstrip()
+        existing_notes = func.trim(func.coalesce(PlanItem.notes, ""), " \t\r\n")
+        values = {"notes": case((existing_notes == "", note), else_=existing_notes + "\n" + note)}
+        if first_sentence:
+            values["task"] = PlanItem.task + f" (Focus: {first_sentence[:60]})"
+        session.exec(
+            update(PlanItem)
+            .where(PlanItem.goal_id == goal_id, PlanItem.day_number > day_number)
+            .values(values)
+        )
 
 
 __all__ = ["AgentOrchestrator"]
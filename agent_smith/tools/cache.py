@@ -0,0 +1,160 @@
+"""Response caches that let agents skip repeated LLM round trips."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+
+from chromadb.api.models import Collection
+from chromadb.errors import NotFoundError
+
+from ..config import get_settings
+from ..logging_config import get_logger
+from .vector import LightweightEmbeddingFunction, get_client
+
+logger = get_logger(__name__)
+
+
+class BaseLLMCache(ABC):
+    """Cache interface consulted by agents before calling their LLM."""
+
+    @abstractmethod
+    def lookup(self, prompt: str, namespace: str = "") -> str | None:
+        """Return a stored response for the prompt, if any.
+
+        ``namespace`` identifies the model and sampling settings; responses are
+        never shared across namespaces.
+        """
+
+    @abstractmethod
+    def update(self, prompt: str, response: str, namespace: str = "") -> None:
+        """Store the response generated for the prompt."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every stored response."""
+
+
+class ChromaLLMCache(BaseLLMCache):
+    """Exact-match cache persisted in Chroma with optional semantic lookups.
+
+    Exact hits are served from a bounded in-process map before touching Chroma.
+    Semantic matching is only attempted when ``similarity_threshold`` is set,
+    since paraphrase detection is only as good as the collection's embeddings.
+    Entries older than ``ttl`` seconds are ignored.
+    """
+
+    def __init__(
+        self,
+        collection_name: str = "agent-smith-llm-cache",
+        similarity_threshold: float | None = None,
+        max_memory_entries: int = 1024,
+        ttl: float = 7 * 86400.0,
+    ) -> None:
+        self.collection_name = collection_name
+        self.similarity_threshold = similarity_threshold
+        self.max_memory_entries = max_memory_entries
+        self.ttl = ttl
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._collection: Collection | None = None
+
+    @property
+    def collection(self) -> Collection:
+        """Return (and lazily create) the backing Chroma collection."""
+
+        if self._collection is None:
+            self._collection = get_client().get_or_create_collection(
+                name=self.collection_name,
+                embedding_function=LightweightEmbeddingFunction(),
+                metadata={"hnsw:space": "cosine"},
+            )
+        return self._collection
+
+    @staticmethod
+    def _key(prompt: str, namespace: str) -> str:
+        payload = f"{namespace}\0{prompt}".encode("utf-8")
+        return hashlib.md5(payload, usedforsecurity=False).hexdigest()
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (created_at, response)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def lookup(self, prompt: str, namespace: str = "") -> str | None:
+        key = self._key(prompt, namespace)
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, response = entry
+                if created_at >= cutoff:
+                    self._memory.move_to_end(key)
+                    return response
+                del self._memory[key]
+
+        record = self.collection.get(ids=[key], include=["metadatas"])
+        if record["ids"]:
+            metadata = record["metadatas"][0]
+            created_at = float(metadata.get("created_at", 0.0))
+            if created_at >= cutoff:
+                response = str(metadata["response"])
+                self._remember(key, response, created_at)
+                return response
+
+        if self.similarity_threshold is None:
+            return None
+
+        result = self.collection.query(
+            query_texts=[prompt],
+            n_results=1,
+            where={"$and": [{"namespace": namespace}, {"created_at": {"$gte": cutoff}}]},
+            include=["metadatas", "distances"],
+        )
+        ids = result["ids"][0]
+        if not ids:
+            return None
+        similarity = 1.0 - result["distances"][0][0]
+        if similarity < self.similarity_threshold:
+            return None
+        logger.info("llm_cache_semantic_hit", similarity=round(similarity, 4))
+        return str(result["metadatas"][0][0]["response"])
+
+    def update(self, prompt: str, response: str, namespace: str = "") -> None:
+        key = self._key(prompt, namespace)
+        created_at = time.time()
+        self._remember(key, response, created_at)
+        self.collection.upsert(
+            ids=[key],
+            documents=[prompt],
+            metadatas=[{"response": response, "namespace": namespace, "created_at": created_at}],
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        try:
+            get_client().delete_collection(self.collection_name)
+        except NotFoundError:
+            pass
+        self._collection = None
+        logger.info("llm_cache_cleared", collection=self.collection_name)
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> BaseLLMCache | None:
+    """Return the shared LLM response cache, or ``None`` when disabled."""
+
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return ChromaLLMCache(similarity_threshold=settings.llm_cache_similarity, ttl=settings.llm_cache_ttl)
+
+
+__all__ = ["BaseLLMCache", "ChromaLLMCache", "get_llm_cache"]
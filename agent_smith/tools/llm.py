@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, TypedDict
 
 from ..config import Settings, get_settings
 from ..logging_config import get_logger
@@ -11,32 +11,97 @@ from ..logging_config import get_logger
 logger = get_logger(__name__)
 
 
+class Message(TypedDict, total=False):
+    """Simple schema for chat-style LLM prompts."""
+
+    role: str
+    content: str
+    cache_control: dict[str, str]
+
+
+Prompt = str | list[Message]
+
+# Sampling defaults for hosted completions.
+DEFAULT_MAX_TOKENS = 512
+DEFAULT_TEMPERATURE = 0.2
+
+
+def render_prompt(prompt: Prompt) -> str:
+    """Flatten a structured prompt into the plain-text form used by local models."""
+
+    if isinstance(prompt, str):
+        return prompt
+    return "\n\n".join(message["content"] for message in prompt if message.get("content"))
+
+
 class BaseLLM(ABC):
     """LLM interface used by agents."""
 
+    #: Whether agents should keep this model's responses in the LLM cache by default.
+    cache_responses: bool = True
+
+    @property
+    def cache_namespace(self) -> str:
+        """Identify the provider, model and sampling settings behind a cached response."""
+
+        return type(self).__name__
+
     @abstractmethod
-    def complete(self, prompt: str, **kwargs: Any) -> str:
+    def complete(self, prompt: Prompt, **kwargs: Any) -> str:
         """Return a completion for the prompt."""
 
 
 class LocalLLM(BaseLLM):
     """Deterministic heuristics for offline generation."""
 
-    def complete(self, prompt: str, max_tokens: int = 512, **_: Any) -> str:
-        important_lines = [line.strip() for line in prompt.splitlines() if len(line.split()) > 3]
-        important_lines = important_lines[-8:]
-        summary = " ".join(important_lines)
-        summary = summary[-(max_tokens * 4) :]
-        if not summary:
-            summary = "Provide actionable study guidance."
-        bullets = self._chunk_text(summary)
+    # A completion is cheaper than the Chroma round trip a cache miss costs.
+    cache_responses = False
+
+    def complete(self, prompt: Prompt, max_tokens: int = 512, **_: Any) -> str:
+        prompt = render_prompt(prompt)
+        # Walk lines from the end so only the lines up to the last eight qualifying
+        # ones are split; the same tokens drive the filter and the chunks.
+        important_lines: list[tuple[str, list[str]]] = []
+        for line in reversed(prompt.splitlines()):
+            line_tokens = line.split()
+            if len(line_tokens) > 3:
+                important_lines.append((line.strip(), line_tokens))
+                if len(important_lines) == 8:
+                    break
+        important_lines.reverse()
+        tokens = self._tail_tokens(important_lines, max_tokens * 4)
+        if not tokens:
+            tokens = "Provide actionable study guidance.".split()
+        bullets = self._chunk_text(tokens)
         return "\n".join(f"- {bullet}" for bullet in bullets if bullet)
 
     @staticmethod
-    def _chunk_text(text: str, chunk_size: int = 24) -> list[str]:
-        tokens = text.split()
-        chunks = [" ".join(tokens[i : i + chunk_size]) for i in range(0, len(tokens), chunk_size)]
-        return chunks[:6]
+    def _tail_tokens(lines: list[tuple[str, list[str]]], max_chars: int) -> list[str]:
+        """Tokens of the last ``max_chars`` characters of the space-joined stripped lines.
+
+        Only a line cut by the budget is re-split; whole lines reuse their tokens.
+        Lengths count each line's own whitespace, so the cut matches slicing the
+        joined text.
+        """
+
+        if max_chars <= 0:
+            # ``text[-0:]`` keeps everything and negative budgets drop a prefix; keep those exact.
+            return " ".join(line for line, _ in lines)[-max_chars:].split()
+        length = -1  # joined length of lines[idx + 1 :]
+        for idx in range(len(lines) - 1, -1, -1):
+            line = lines[idx][0]
+            if length + len(line) + 1 > max_chars:
+                room = max_chars - length - 1  # characters left for the end of this line
+                head = line[-room:].split() if room > 0 else []
+                return head + [token for _, line_tokens in lines[idx + 1 :] for token in line_tokens]
+            length += len(line) + 1
+        return [token for _, line_tokens in lines for token in line_tokens]
+
+    @staticmethod
+    def _chunk_text(tokens: list[str], chunk_size: int = 24, max_chunks: int = 6) -> list[str]:
+        # Bound the range up front so tokens past the last chunk are never sliced or joined.
+        end = min(len(tokens), max_chunks * chunk_size)
+        return [" ".join(tokens[i : i + chunk_size]) for i in range(0, end, chunk_size)]
 
 
 class OpenAILLM(BaseLLM):
@@ -51,18 +116,57 @@ class OpenAILLM(BaseLLM):
         self.client = OpenAI(api_key=api_key)
         self.model = model
 
-    def complete(self, prompt: str, max_tokens: int = 512, temperature: float = 0.2, **_: Any) -> str:
-        response = self.client.responses.create(
+    @property
+    def cache_namespace(self) -> str:
+        # Agents only cache calls made with the default sampling settings.
+        return f"openai:{self.model}:max_tokens={DEFAULT_MAX_TOKENS}:temperature={DEFAULT_TEMPERATURE}"
+
+    @staticmethod
+    def _input(prompt: Prompt) -> str | list[dict[str, str]]:
+        """Convert messages to Responses API input, static prefix first.
+
+        OpenAI caches long prompt prefixes automatically, so ``cache_control``
+        hints are dropped rather than forwarded.
+        """
+
+        if isinstance(prompt, str):
+            return prompt
+        return [{"role": message["role"], "content": message["content"]} for message in prompt]
+
+    @staticmethod
+    def _log_usage(response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            details = getattr(usage, "input_tokens_details", None)
+            logger.info(
+                "llm_usage",
+                provider="openai",
+                input_tokens=usage.input_tokens,
+                cache_read_input_tokens=getattr(details, "cached_tokens", 0),
+            )
+
+    def complete_stream(
+        self,
+        prompt: Prompt,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE,
+        **_: Any,
+    ) -> Iterator[str]:
+        """Yield output text deltas as the model produces them."""
+
+        with self.client.responses.stream(
             model=self.model,
-            input=prompt,
+            input=self._input(prompt),
             max_output_tokens=max_tokens,
             temperature=temperature,
-        )
-        parts = []
-        for item in response.output:
-            if item.type == "output_text":
-                parts.append(item.text)
-        return "".join(parts)
+        ) as stream:
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+            self._log_usage(stream.get_final_response())
+
+    def complete(self, prompt: Prompt, **kwargs: Any) -> str:
+        return "".join(self.complete_stream(prompt, **kwargs))
 
 
 def get_llm(settings: Settings | None = None) -> BaseLLM:
@@ -79,4 +183,4 @@ def get_llm(settings: Settings | None = None) -> BaseLLM:
     return LocalLLM()
 
 
-__all__ = ["BaseLLM", "LocalLLM", "OpenAILLM", "get_llm"]
+__all__ = ["BaseLLM", "LocalLLM", "Message", "OpenAILLM", "Prompt", "get_llm", "render_prompt"]
@@ -2,127 +2,359 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import math
+import re
+from collections import Counter
 from functools import lru_cache
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, TypedDict
 from uuid import uuid4
 
 import chromadb
+import numpy as np
 from chromadb.api import ClientAPI
 from chromadb.api.models import Collection
-from chromadb.utils.embedding_functions import EmbeddingFunction
+from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.utils.embedding_functions import EmbeddingFunction, OpenAIEmbeddingFunction
 
 from ..config import get_settings
 from ..logging_config import get_logger
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
 logger = get_logger(__name__)
 
+# Rows per Chroma upsert; large single upserts degrade HNSW insertion and memory.
+BATCH_SIZE = 200
+
+# ASCII characters that str.split() treats as whitespace but bytes.split() does not.
+_INFORMATION_SEPARATORS = re.compile("[\x1c-\x1f]")
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_digest(token: bytes) -> bytes:
+    """SHA-256 of a token; common words recur across texts, so digests are memoised."""
+
+    return hashlib.sha256(token).digest()
+
+
+def _tokenize(text: str) -> list[bytes]:
+    """Lowercased, whitespace-split UTF-8 tokens of ``text``."""
+
+    if text.isascii() and not _INFORMATION_SEPARATORS.search(text):
+        # Byte-level lower/split match the str methods here and skip per-token encodes.
+        return text.encode("ascii").lower().split()
+    return [token.encode("utf-8") for token in text.lower().split()]
+
+
+def _accumulate_numpy(digests: np.ndarray, weights: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """Write the normalized, weighted per-text digest sums into ``out``.
+
+    ``digests`` holds one row per distinct token of each text, ``weights`` its
+    occurrence count, and ``offsets[i]:offsets[i + 1]`` selects the rows of text
+    ``i``. Dimensions past the digest length wrap around.
+    """
+
+    counts = np.diff(offsets)
+    has_tokens = counts > 0
+    # reduceat cannot express empty runs, so texts without tokens stay zero.
+    sums = np.zeros((counts.shape[0], digests.shape[1]), dtype=np.int64)
+    if digests.shape[0]:
+        weighted = digests * weights[:, np.newaxis]
+        sums[has_tokens] = np.add.reduceat(weighted, offsets[:-1][has_tokens], axis=0)
+
+    vectors = sums[:, np.arange(out.shape[1]) % digests.shape[1]].astype(np.float32) / 255.0
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    np.divide(vectors, norms, out=out)
+
+
+def _accumulate_kernel(digests, weights, offsets, out):  # pragma: no cover - compiled by numba
+    """Fused sum/scale/normalize loop over the texts of a batch."""
+
+    digest_size = digests.shape[1]
+    dimensions = out.shape[1]
+    for text in range(offsets.shape[0] - 1):
+        sums = np.zeros(digest_size, dtype=np.int64)
+        for row in range(offsets[text], offsets[text + 1]):
+            for col in range(digest_size):
+                sums[col] += digests[row, col] * weights[row]
+        norm = 0.0
+        for dim in range(dimensions):
+            value = sums[dim % digest_size] / 255.0
+            norm += value * value
+        scale = 1.0 / np.sqrt(norm) if norm > 0 else 1.0
+        for dim in range(dimensions):
+            out[text, dim] = sums[dim % digest_size] / 255.0 * scale
+
+
+_accumulate = njit(cache=True)(_accumulate_kernel) if njit is not None else _accumulate_numpy
+
 
 class LightweightEmbeddingFunction(EmbeddingFunction):
-    """Deterministic hashing-based embeddings for local execution."""
+    """Deterministic hashing-based embeddings for local execution.
+
+    With ``quantize`` the normalized vectors are rounded to int8 steps (1/127)
+    before being returned. Cosine similarity is preserved up to that rounding
+    noise; Chroma still stores float32, so this only bounds the precision a
+    compact int8 store would keep and does not shrink the collection itself.
+    """
 
-    def __init__(self, dimensions: int = 64) -> None:
+    def __init__(self, dimensions: int = 64, quantize: bool = False) -> None:
         self.dimensions = dimensions
+        self.quantize = quantize
 
     def __call__(self, input: Sequence[str]) -> list[list[float]]:  # type: ignore[override]
-        vectors: list[list[float]] = []
-        for text in input:
-            accumulator = [0.0] * self.dimensions
-            for token in text.lower().split():
-                digest = hashlib.sha256(token.encode("utf-8")).digest()
-                for idx in range(self.dimensions):
-                    accumulator[idx] += digest[idx] / 255.0
-            norm = math.sqrt(sum(value * value for value in accumulator)) or 1.0
-            vectors.append([value / norm for value in accumulator])
-        return vectors
+        # Repeated tokens are hashed and summed once, weighted by their count.
+        token_counts = [Counter(_tokenize(text)) for text in input]
+        offsets = np.zeros(len(token_counts) + 1, dtype=np.intp)
+        np.cumsum([len(counter) for counter in token_counts], out=offsets[1:])
+        tokens = [token for counter in token_counts for token in counter]
+        weights = np.fromiter(
+            (count for counter in token_counts for count in counter.values()),
+            dtype=np.int64,
+            count=len(tokens),
+        )
+
+        digests = np.frombuffer(b"".join(map(_token_digest, tokens)), dtype=np.uint8)
+        digests = digests.reshape(len(tokens), hashlib.sha256().digest_size)
+        vectors = np.empty((len(token_counts), self.dimensions), dtype=np.float32)
+        _accumulate(digests, weights, offsets, vectors)
+        if self.quantize:
+            vectors = np.rint(vectors * 127).astype(np.int8).astype(np.float32) / 127
+        return vectors.tolist()
 
 
 @lru_cache(maxsize=1)
 def get_client() -> ClientAPI:
-    """Return a cached persistent Chroma client."""
+    """Return a cached Chroma client, remote when ``chroma_host`` is configured."""
 
     settings = get_settings()
+    if settings.chroma_host:
+        return chromadb.HttpClient(host=settings.chroma_host, port=settings.chroma_port)
     return chromadb.PersistentClient(path=str(settings.chroma_path))
 
 
+# Used for resource embeddings whenever an OpenAI key is configured.
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+
+
+@lru_cache(maxsize=1)
+def _embedding_function() -> tuple[str, EmbeddingFunction]:
+    """Return the configured embedding kind and function for resource collections.
+
+    OpenAI embeddings are used when a key is set, falling back to the local
+    hashing embedder if they cannot be initialised.
+    """
+
+    settings = get_settings()
+    if settings.openai_api_key:
+        try:
+            embedding_function = OpenAIEmbeddingFunction(
+                api_key=settings.openai_api_key,
+                model_name=OPENAI_EMBEDDING_MODEL,
+                api_key_env_var="OPENAI_API_KEY",
+            )
+            logger.info("embedding_provider", provider="openai")
+            return "openai", embedding_function
+        except Exception as exc:  # pragma: no cover - degrade gracefully
+            logger.warning("openai_embeddings_init_failed", error=str(exc))
+    logger.info("embedding_provider", provider="hashing")
+    return "hashing", LightweightEmbeddingFunction(quantize=settings.embedding_quantize)
+
+
+def _collection_name(name: str, kind: str) -> str:
+    # Vector dimensions differ per embedding kind, so each kind gets its own collection.
+    return name if kind == "hashing" else f"{name}-{kind}"
+
+
 @lru_cache(maxsize=1)
 def get_collection(name: str = "agent-smith-resources") -> Collection:
     """Return (and lazily create) the shared resource collection."""
 
-    client = get_client()
-    embedding_function = LightweightEmbeddingFunction()
-    return client.get_or_create_collection(name=name, embedding_function=embedding_function)
+    kind, embedding_function = _embedding_function()
+    return get_client().get_or_create_collection(
+        name=_collection_name(name, kind),
+        embedding_function=embedding_function,
+    )
+
 
+_async_collections: dict[str, AsyncCollection] = {}
 
-def _resource_payload(resource: "Resource") -> tuple[str, str, dict[str, str | int | float | None]]:
+
+async def get_async_collection(name: str = "agent-smith-resources") -> AsyncCollection:
+    """Return the shared resource collection through Chroma's async HTTP client.
+
+    Only available when ``chroma_host`` points at a Chroma server.
+    """
+
+    collection = _async_collections.get(name)
+    if collection is None:
+        settings = get_settings()
+        if not settings.chroma_host:
+            raise RuntimeError("An async Chroma client requires AGENT_SMITH_CHROMA_HOST")
+        client = await chromadb.AsyncHttpClient(host=settings.chroma_host, port=settings.chroma_port)
+        kind, embedding_function = _embedding_function()
+        collection = await client.get_or_create_collection(
+            name=_collection_name(name, kind),
+            embedding_function=embedding_function,
+        )
+        _async_collections[name] = collection
+    return collection
+
+
+class _ResourceMetadata(TypedDict):
+    """Metadata stored next to each resource vector."""
+
+    goal_id: int
+    plan_item_id: int | None
+    title: str
+    url: str | None
+    source: str | None
+
+
+def _resource_payload(resource: "Resource") -> tuple[str, str, _ResourceMetadata]:
     """Build payload tuple for Chroma upsert."""
 
     doc = resource.content or resource.snippet or resource.title
-    metadata = {
+    metadata: _ResourceMetadata = {
         "goal_id": resource.goal_id,
         "plan_item_id": resource.plan_item_id,
         "title": resource.title,
         "url": resource.url,
         "source": resource.source,
     }
-    vector_id = resource.vector_id or f"resource-{resource.id or uuid4()}"
+    vector_id = resource.vector_id
+    if not vector_id:
+        # Only rows that were never flushed lack a primary key and need a random id.
+        vector_id = f"resource-{resource.id}" if resource.id else f"resource-{uuid4()}"
     return vector_id, doc, metadata
 
 
-def upsert_resources(resources: Iterable["Resource"]) -> list[str]:
-    """Persist resources into the vector store and return their vector ids."""
+def _prepare_upsert(
+    resources: Iterable["Resource"],
+) -> tuple[list[str], list[str], list[_ResourceMetadata]]:
+    """Assign vector ids and build the parallel upsert columns."""
 
-    collection = get_collection()
     ids: list[str] = []
     documents: list[str] = []
-    metadatas: list[dict[str, str | int | float | None]] = []
+    metadatas: list[_ResourceMetadata] = []
 
-    from ..models import Resource  # Local import to avoid circular dependency
+    if __debug__:  # Safety check for callers; skipped under ``python -O``
+        from ..models import Resource  # Local import to avoid circular dependency
 
     for resource in resources:
-        if not isinstance(resource, Resource):  # Safety check for callers
+        if __debug__ and not isinstance(resource, Resource):
             raise TypeError("upsert_resources expects Resource instances")
         vector_id, document, metadata = _resource_payload(resource)
         resource.vector_id = vector_id
         ids.append(vector_id)
         documents.append(document)
         metadatas.append(metadata)
+    return ids, documents, metadatas
+
 
+def upsert_resources(resources: Iterable["Resource"]) -> list[str]:
+    """Persist resources into the vector store and return their vector ids."""
+
+    ids, documents, metadatas = _prepare_upsert(resources)
     if not ids:
         return []
 
+    collection = get_collection()
     logger.info("vector_upsert", count=len(ids))
-    collection.upsert(ids=ids, documents=documents, metadatas=metadatas)
+    for start in range(0, len(ids), BATCH_SIZE):
+        end = start + BATCH_SIZE
+        collection.upsert(ids=ids[start:end], documents=documents[start:end], metadatas=metadatas[start:end])
     return ids
 
 
-def search_resources(query: str, goal_id: int | None = None, limit: int = 5) -> list[dict[str, object]]:
-    """Search the vector store for semantically similar resources."""
+async def upsert_resources_async(resources: Iterable["Resource"]) -> list[str]:
+    """Async variant of :func:`upsert_resources`.
+
+    Batches are embedded in worker threads and sent concurrently through the
+    async HTTP client when a Chroma server is configured; the embedded store
+    falls back to a worker thread.
+    """
+
+    if not get_settings().chroma_host:
+        return await asyncio.to_thread(upsert_resources, resources)
+
+    ids, documents, metadatas = _prepare_upsert(resources)
+    if not ids:
+        return []
+
+    collection = await get_async_collection()
+    _, embedding_function = _embedding_function()
+
+    async def upsert_batch(start: int) -> None:
+        end = start + BATCH_SIZE
+        # AsyncCollection.upsert would embed inline on the event loop, so embed in a worker thread.
+        embeddings = await asyncio.to_thread(embedding_function, documents[start:end])
+        await collection.upsert(
+            ids=ids[start:end],
+            embeddings=embeddings,
+            documents=documents[start:end],
+            metadatas=metadatas[start:end],
+        )
+
+    logger.info("vector_upsert", count=len(ids))
+    await asyncio.gather(*(upsert_batch(start) for start in range(0, len(ids), BATCH_SIZE)))
+    return ids
+
+
+def search_resources_batch(
+    queries: Sequence[str],
+    goal_id: int | None = None,
+    limit: int = 5,
+) -> list[list[dict[str, object]]]:
+    """Search the vector store for several queries in a single round trip."""
+
+    if not queries:
+        return []
 
     collection = get_collection()
     where = {"goal_id": goal_id} if goal_id is not None else None
-    logger.info("vector_search", query=query, goal_id=goal_id, limit=limit)
-    result = collection.query(query_texts=[query], n_results=limit, where=where)
-
-    matches: list[dict[str, object]] = []
-    ids = result.get("ids", [[]])[0]
-    documents = result.get("documents", [[]])[0]
-    metadatas = result.get("metadatas", [[]])[0]
-    distances = result.get("distances", [[]])[0]
-
-    for idx, vector_id in enumerate(ids):
-        metadata = metadatas[idx] if idx < len(metadatas) else {}
-        matches.append(
+    logger.info("vector_search", query_count=len(queries), goal_id=goal_id, limit=limit)
+    result = collection.query(
+        query_texts=list(queries),
+        n_results=limit,
+        where=where,
+        include=["documents", "metadatas", "distances"],
+    )
+
+    # Every included column is aligned with ids, so rows are indexed directly.
+    documents, metadatas, distances = result["documents"], result["metadatas"], result["distances"]
+    return [
+        [
             {
                 "vector_id": vector_id,
-                "document": documents[idx] if idx < len(documents) else None,
-                "metadata": metadata,
-                "distance": distances[idx] if idx < len(distances) else None,
+                "document": documents[query_idx][idx],
+                "metadata": metadatas[query_idx][idx],
+                "distance": distances[query_idx][idx],
             }
-        )
+            for idx, vector_id in enumerate(ids)
+        ]
+        for query_idx, ids in enumerate(result["ids"])
+    ]
+
+
+def search_resources(query: str, goal_id: int | None = None, limit: int = 5) -> list[dict[str, object]]:
+    """Search the vector store for semantically similar resources."""
 
-    return matches
+    return search_resources_batch([query], goal_id=goal_id, limit=limit)[0]
 
 
-__all__ = ["get_collection", "search_resources", "upsert_resources"]
+__all__ = [
+    "BATCH_SIZE",
+    "OPENAI_EMBEDDING_MODEL",
+    "get_async_collection",
+    "get_collection",
+    "search_resources",
+    "search_resources_batch",
+    "upsert_resources",
+    "upsert_resources_async",
+]
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import asyncio
+import atexit
+import io
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable
 
+import hishel
 import httpx
-from bs4 import BeautifulSoup
 from duckduckgo_search import DDGS
+from hishel.httpx import AsyncCacheTransport, SyncCacheTransport
+from lxml import etree
 
+from ..config import get_settings
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_ARXIV_API_URL = "http://export.arxiv.org/api/query"
+_ATOM_NS = {"a": "http://www.w3.org/2005/Atom"}
+_ENTRY_TITLE = etree.XPath("string(a:title)", namespaces=_ATOM_NS)
+_ENTRY_SUMMARY = etree.XPath("string(a:summary)", namespaces=_ATOM_NS)
+# Two expressions rather than a union: a union yields document order, not preference.
+_ENTRY_PDF_HREF = etree.XPath('a:link[@title="pdf"]/@href', namespaces=_ATOM_NS)
+_ENTRY_ALTERNATE_HREF = etree.XPath('a:link[@rel="alternate"]/@href', namespaces=_ATOM_NS)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Normalized representation of search hits."""
 
@@ -24,7 +39,8 @@ class SearchResult:
     source: str
 
     def asdict(self) -> dict[str, str]:
-        return asdict(self)
+        # The fields are flat strings, so skip dataclasses.asdict's recursive deep copy.
+        return {"title": self.title, "url": self.url, "snippet": self.snippet, "source": self.source}
 
 
 def duckduckgo_search(query: str, max_results: int = 5) -> list[SearchResult]:
@@ -45,15 +61,82 @@ def duckduckgo_search(query: str, max_results: int = 5) -> list[SearchResult]:
     return hits
 
 
-def wikipedia_search(topic: str, sentences: int = 3) -> list[SearchResult]:
-    """Query the public Wikipedia REST API for concise topic summaries."""
+class _SuccessfulResponse(hishel.BaseFilter[hishel.Response]):
+    """Only store 2xx responses so transient upstream errors are retried."""
 
-    url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{topic}".replace(" ", "%20")
-    logger.info("wikipedia_search", topic=topic)
-    with httpx.Client(timeout=10.0) as client:
-        response = client.get(url)
-        response.raise_for_status()
-    payload = response.json()
+    def needs_body(self) -> bool:
+        return False
+
+    def apply(self, item: hishel.Response, body: bytes | None) -> bool:
+        return 200 <= item.status_code < 300
+
+
+def _cache_policy() -> hishel.FilterPolicy:
+    # Wikipedia and arXiv send short or no-cache headers, so cache on our own TTL
+    # rather than following the HTTP caching spec.
+    return hishel.FilterPolicy(response_filters=[_SuccessfulResponse()])
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the shared keep-alive HTTP/2 client used by the sync search helpers."""
+
+    settings = get_settings()
+    transport: httpx.BaseTransport = httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    if settings.http_cache_enabled:
+        storage = hishel.SyncSqliteStorage(
+            database_path=settings.http_cache_path,
+            default_ttl=settings.http_cache_ttl,
+        )
+        transport = SyncCacheTransport(transport, storage=storage, policy=_cache_policy())
+    return httpx.Client(transport=transport, timeout=10.0)
+
+
+def close_http_client() -> None:
+    """Close the shared sync client if it was created."""
+
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
+        get_http_client.cache_clear()
+
+
+atexit.register(close_http_client)
+
+
+@lru_cache(maxsize=1)
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared keep-alive HTTP/2 client used by the async search helpers."""
+
+    settings = get_settings()
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    if settings.http_cache_enabled:
+        storage = hishel.AsyncSqliteStorage(
+            database_path=settings.http_cache_path,
+            default_ttl=settings.http_cache_ttl,
+        )
+        transport = AsyncCacheTransport(transport, storage=storage, policy=_cache_policy())
+    return httpx.AsyncClient(transport=transport, timeout=10.0)
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async client (if created) so its pool is not reused across event loops."""
+
+    if get_async_http_client.cache_info().currsize:
+        await get_async_http_client().aclose()
+        get_async_http_client.cache_clear()
+
+
+def _wikipedia_url(topic: str) -> str:
+    return f"https://en.wikipedia.org/api/rest_v1/page/summary/{topic}".replace(" ", "%20")
+
+
+def _wikipedia_results(payload: dict[str, Any], topic: str, url: str, sentences: int) -> list[SearchResult]:
     extract = payload.get("extract") or ""
     snippet = " ".join(extract.split()[: sentences * 20])  # approx sentences
     title = payload.get("title") or topic
@@ -61,23 +144,97 @@ def wikipedia_search(topic: str, sentences: int = 3) -> list[SearchResult]:
     return [SearchResult(title=title, url=canonical_url, snippet=snippet, source="wikipedia")]
 
 
+def wikipedia_search(topic: str, sentences: int = 3) -> list[SearchResult]:
+    """Query the public Wikipedia REST API for concise topic summaries."""
+
+    url = _wikipedia_url(topic)
+    logger.info("wikipedia_search", topic=topic)
+    response = get_http_client().get(url)
+    response.raise_for_status()
+    return _wikipedia_results(response.json(), topic, url, sentences)
+
+
+async def wikipedia_search_async(
+    topic: str,
+    sentences: int = 3,
+    client: httpx.AsyncClient | None = None,
+) -> list[SearchResult]:
+    """Async variant of :func:`wikipedia_search` over a pooled client."""
+
+    url = _wikipedia_url(topic)
+    logger.info("wikipedia_search", topic=topic)
+    response = await (client or get_async_http_client()).get(url)
+    response.raise_for_status()
+    return _wikipedia_results(response.json(), topic, url, sentences)
+
+
+def _arxiv_params(query: str, max_results: int) -> dict[str, str | int]:
+    return {"search_query": f"all:{query}", "start": 0, "max_results": max_results}
+
+
+def _arxiv_results(feed: bytes) -> list[SearchResult]:
+    hits: list[SearchResult] = []
+    # Stream entries instead of building the whole document tree.
+    entries = etree.iterparse(io.BytesIO(feed), tag=f"{{{_ATOM_NS['a']}}}entry")
+    try:
+        for _, entry in entries:
+            title = _ENTRY_TITLE(entry).strip() or "Untitled"
+            summary = _ENTRY_SUMMARY(entry).strip().replace("\n", " ")
+            hrefs = _ENTRY_PDF_HREF(entry) or _ENTRY_ALTERNATE_HREF(entry)
+            href = str(hrefs[0]) if hrefs else ""
+            hits.append(SearchResult(title=title, url=href, snippet=summary, source="arxiv"))
+            entry.clear()
+    except etree.XMLSyntaxError as exc:
+        # Empty, truncated or HTML bodies: keep the entries parsed so far.
+        logger.warning("arxiv_feed_malformed", error=str(exc), parsed=len(hits))
+    return hits
+
+
 def arxiv_search(query: str, max_results: int = 3) -> list[SearchResult]:
     """Lightweight arXiv API wrapper that parses Atom feeds."""
 
-    base_url = "http://export.arxiv.org/api/query"
-    params = {"search_query": f"all:{query}", "start": 0, "max_results": max_results}
     logger.info("arxiv_search", query=query, max_results=max_results)
-    with httpx.Client(timeout=10.0) as client:
-        response = client.get(base_url, params=params)
-        response.raise_for_status()
-    soup = BeautifulSoup(response.text, "xml")
+    response = get_http_client().get(_ARXIV_API_URL, params=_arxiv_params(query, max_results))
+    response.raise_for_status()
+    return _arxiv_results(response.content)
+
+
+async def arxiv_search_async(
+    query: str,
+    max_results: int = 3,
+    client: httpx.AsyncClient | None = None,
+) -> list[SearchResult]:
+    """Async variant of :func:`arxiv_search` over a pooled client."""
+
+    logger.info("arxiv_search", query=query, max_results=max_results)
+    response = await (client or get_async_http_client()).get(_ARXIV_API_URL, params=_arxiv_params(query, max_results))
+    response.raise_for_status()
+    return _arxiv_results(response.content)
+
+
+async def multi_search(
+    query: str,
+    max_results: int = 5,
+    client: httpx.AsyncClient | None = None,
+) -> list[SearchResult]:
+    """Query DuckDuckGo, Wikipedia and arXiv concurrently and merge the hits.
+
+    A source that fails is logged and skipped so the others still return.
+    """
+
+    sources = ("duckduckgo", "wikipedia", "arxiv")
+    outcomes = await asyncio.gather(
+        asyncio.to_thread(duckduckgo_search, query, max_results=max_results),
+        wikipedia_search_async(query, client=client),
+        arxiv_search_async(query, max_results=max_results, client=client),
+        return_exceptions=True,
+    )
     hits: list[SearchResult] = []
-    for entry in soup.find_all("entry"):
-        title = (entry.title or "Untitled").text.strip()
-        summary = (entry.summary or "").text.strip().replace("\n", " ")
-        link_tag = entry.find("link", attrs={"title": "pdf"}) or entry.find("link", attrs={"rel": "alternate"})
-        href = link_tag["href"] if link_tag and link_tag.has_attr("href") else ""
-        hits.append(SearchResult(title=title, url=href, snippet=summary, source="arxiv"))
+    for source, outcome in zip(sources, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("multi_search_source_failed", source=source, error=str(outcome))
+            continue
+        hits.extend(outcome)
     return hits
 
 
@@ -90,7 +247,14 @@ def to_serializable(results: Iterable[SearchResult]) -> list[dict[str, str]]:
 __all__ = [
     "SearchResult",
     "arxiv_search",
+    "arxiv_search_async",
+    "close_async_http_client",
+    "close_http_client",
     "duckduckgo_search",
+    "get_async_http_client",
+    "get_http_client",
+    "multi_search",
     "to_serializable",
     "wikipedia_search",
+    "wikipedia_search_async",
 ]
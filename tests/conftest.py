@@ -0,0 +1,17 @@
+"""Shared pytest setup: point all on-disk state at a throwaway directory."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+# Settings are read when agent_smith.db is first imported, so this must run
+# before any test module imports the app. Values are assigned unconditionally so
+# an exported variable can never point the suite at a real database or service.
+_STATE_DIR = Path(tempfile.mkdtemp(prefix="agent-smith-tests-"))
+os.environ["AGENT_SMITH_SQLITE_PATH"] = str(_STATE_DIR / "agent_smith.db")
+os.environ["AGENT_SMITH_CHROMA_PATH"] = str(_STATE_DIR / "chroma")
+os.environ["AGENT_SMITH_HTTP_CACHE_PATH"] = str(_STATE_DIR / "http_cache.db")
+os.environ["AGENT_SMITH_CHROMA_HOST"] = ""
+os.environ["OPENAI_API_KEY"] = ""
@@ -0,0 +1,88 @@
+"""Smoke tests that boot the FastAPI app against a temporary database."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agent_smith.app import app
+from agent_smith.db import get_session
+from agent_smith.models import QuizItem, QuizStatus
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_health(client: TestClient) -> None:
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_goal_round_trip(client: TestClient) -> None:
+    created = client.post("/goals", json={"title": "Learn Rust", "target_days": 7})
+    assert created.status_code == 200
+    goal = created.json()
+    assert goal["status"] == "new"
+
+    fetched = client.get(f"/goals/{goal['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json()["title"] == "Learn Rust"
+    assert client.get(f"/goals/{goal['id']}/plan").json() == []
+
+
+def test_unknown_goal_is_404(client: TestClient) -> None:
+    assert client.get("/goals/999999").status_code == 404
+
+
+def _add_quiz_items(goal_id: int, answers: list[str]) -> list[int]:
+    with get_session() as session:
+        items = [
+            QuizItem(goal_id=goal_id, question=f"Question {idx}?", answer=answer, status=QuizStatus.DELIVERED)
+            for idx, answer in enumerate(answers)
+        ]
+        session.add_all(items)
+        session.commit()
+        return [item.id for item in items]
+
+
+def test_submit_answers_grades_in_request_order(client: TestClient) -> None:
+    goal = client.post("/goals", json={"title": "Learn Go"}).json()
+    first, second = _add_quiz_items(goal["id"], ["goroutines and channels", "interfaces"])
+
+    response = client.post(
+        "/quiz/answers",
+        json=[{"quiz_id": second, "answer": "structs"}, {"quiz_id": first, "answer": "channels and goroutines"}],
+    )
+
+    assert response.status_code == 200
+    graded = response.json()
+    assert [item["id"] for item in graded] == [second, first]
+    assert [item["is_correct"] for item in graded] == [False, True]
+    assert all(item["status"] == "answered" for item in graded)
+    assert graded[0]["learner_answer"] == "structs"
+
+
+def test_submit_answers_unknown_quiz_is_404(client: TestClient) -> None:
+    response = client.post("/quiz/answers", json=[{"quiz_id": 999999, "answer": "x"}])
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Quiz items [999999] not found"}
+
+
+def test_submit_answers_rejects_duplicate_quiz_ids(client: TestClient) -> None:
+    goal = client.post("/goals", json={"title": "Learn Zig"}).json()
+    (quiz_id,) = _add_quiz_items(goal["id"], ["comptime"])
+
+    response = client.post(
+        "/quiz/answers",
+        json=[{"quiz_id": quiz_id, "answer": "first"}, {"quiz_id": quiz_id, "answer": "second"}],
+    )
+
+    assert response.status_code == 422
+    assert response.json() == {"detail": f"Duplicate quiz ids [{quiz_id}]"}
+    assert client.get(f"/goals/{goal['id']}/quiz/1").json()[0]["learner_answer"] is None
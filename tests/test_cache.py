@@ -0,0 +1,65 @@
+"""LLM response cache keyed by model namespace with a TTL."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+
+from agent_smith.agents.planner import PlannerAgent
+from agent_smith.tools import cache as cache_module
+from agent_smith.tools.cache import ChromaLLMCache
+from agent_smith.tools.llm import DEFAULT_MAX_TOKENS, DEFAULT_TEMPERATURE, LocalLLM, OpenAILLM
+
+
+@pytest.fixture
+def llm_cache() -> ChromaLLMCache:
+    cache = ChromaLLMCache(collection_name=f"test-llm-cache-{uuid4().hex}", ttl=60.0)
+    yield cache
+    cache.clear()
+
+
+def test_responses_are_isolated_by_namespace(llm_cache: ChromaLLMCache) -> None:
+    llm_cache.update("prompt", "local answer", "LocalLLM")
+
+    assert llm_cache.lookup("prompt", "LocalLLM") == "local answer"
+    assert llm_cache.lookup("prompt", "openai:gpt-4o-mini") is None
+
+
+def test_persisted_responses_survive_a_cold_memory(llm_cache: ChromaLLMCache) -> None:
+    llm_cache.update("prompt", "answer", "ns")
+    llm_cache._memory.clear()
+
+    assert llm_cache.lookup("prompt", "ns") == "answer"
+
+
+def test_expired_responses_are_ignored(llm_cache: ChromaLLMCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    llm_cache.update("prompt", "answer", "ns")
+    now = cache_module.time.time()
+    monkeypatch.setattr(cache_module.time, "time", lambda: now + llm_cache.ttl + 1)
+
+    assert llm_cache.lookup("prompt", "ns") is None
+    llm_cache._memory.clear()
+    assert llm_cache.lookup("prompt", "ns") is None
+
+
+def test_clear_drops_everything(llm_cache: ChromaLLMCache) -> None:
+    llm_cache.update("prompt", "answer", "ns")
+    llm_cache.clear()
+
+    assert llm_cache.lookup("prompt", "ns") is None
+
+
+def test_openai_namespace_includes_model_and_sampling() -> None:
+    llm = OpenAILLM.__new__(OpenAILLM)  # skip client construction
+    llm.model = "gpt-4o-mini"
+
+    assert llm.cache_namespace == (
+        f"openai:gpt-4o-mini:max_tokens={DEFAULT_MAX_TOKENS}:temperature={DEFAULT_TEMPERATURE}"
+    )
+    assert LocalLLM().cache_namespace == "LocalLLM"
+
+
+def test_local_llm_skips_shared_cache_unless_given_one(llm_cache: ChromaLLMCache) -> None:
+    assert PlannerAgent(llm=LocalLLM()).llm_cache is None
+    assert PlannerAgent(llm=LocalLLM(), llm_cache=llm_cache).llm_cache is llm_cache
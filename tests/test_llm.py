@@ -0,0 +1,55 @@
+"""Offline LocalLLM heuristics."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from agent_smith.tools.llm import LocalLLM
+
+
+def _complete_by_slicing(prompt: str, max_tokens: int = 512) -> str:
+    """The original implementation: join the kept lines and slice the text."""
+
+    important_lines = [line.strip() for line in prompt.splitlines() if len(line.split()) > 3]
+    summary = " ".join(important_lines[-8:])[-(max_tokens * 4) :]
+    if not summary:
+        summary = "Provide actionable study guidance."
+    tokens = summary.split()
+    chunks = [" ".join(tokens[i : i + 24]) for i in range(0, len(tokens), 24)][:6]
+    return "\n".join(f"- {bullet}" for bullet in chunks if bullet)
+
+
+@pytest.mark.parametrize("max_tokens", [512, 20, 2, 1, 0, -3])
+def test_complete_matches_slicing_with_irregular_whitespace(max_tokens: int) -> None:
+    prompt = "Resources:\n- Title:  a  double  spaced\tsnippet with tabs\n\tshort\n" + "word  " * 30
+    assert LocalLLM().complete(prompt, max_tokens=max_tokens) == _complete_by_slicing(prompt, max_tokens)
+
+
+def test_complete_matches_slicing_on_random_prompts() -> None:
+    words = ["alpha", "be", "c", "delta-long-word", "e", "snippet:"]
+    separators = [" ", "  ", "\t", " \t ", "   "]
+    rng = random.Random(5)
+    llm = LocalLLM()
+    for _ in range(2000):
+        lines = [
+            rng.choice(["", "  ", "\t"])
+            + "".join(word + rng.choice(separators) for word in rng.choices(words, k=rng.randint(0, 40)))
+            for _ in range(rng.randint(0, 20))
+        ]
+        prompt = "\n".join(lines)
+        max_tokens = rng.choice([512, 0, 1, 8, 50])
+        assert llm.complete(prompt, max_tokens=max_tokens) == _complete_by_slicing(prompt, max_tokens)
+
+
+def test_complete_renders_messages_and_falls_back() -> None:
+    llm = LocalLLM()
+    messages = [
+        {"role": "system", "content": "You are a planner. Produce steps."},
+        {"role": "user", "content": "Goal: learn rust quickly\nx"},
+    ]
+    assert llm.complete(messages) == "- You are a planner. Produce steps. Goal: learn rust quickly"
+    assert llm.complete("short") == "- Provide actionable study guidance."
+    long_prompt = ("word " * 30 + "\n") * 8
+    assert llm.complete(long_prompt).count("\n") == 5  # capped at six bullets
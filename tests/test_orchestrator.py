@@ -0,0 +1,76 @@
+"""Persistence helpers of the agent orchestrator."""
+
+from __future__ import annotations
+
+import pytest
+from sqlmodel import select
+
+from agent_smith.db import get_session, init_db
+from agent_smith.models import LearningGoal, PlanItem
+from agent_smith.orchestrator import AgentOrchestrator
+
+
+@pytest.fixture(scope="module")
+def orchestrator() -> AgentOrchestrator:
+    init_db()
+    return AgentOrchestrator()
+
+
+def _rewrite_in_python(item: PlanItem, day_number: int, reflection: str) -> tuple[str, str]:
+    """The original per-row rewrite the single UPDATE replaced."""
+
+    task = item.task
+    first_sentence = reflection.split(".")[0].strip()
+    if first_sentence:
+        task = f"{task} (Focus: {first_sentence[:60]})"
+    note = f"Reflection applied on day {day_number}: {reflection[:200]}"
+    return task, f"{(item.notes or '').strip()}\n{note}".strip()
+
+
+@pytest.mark.parametrize(
+    "reflection",
+    [
+        "Practice more. Then review.",
+        "Do A." + " " * 180 + "\n" + " " * 30 + "B",
+        ". Leading period means no focus sentence",
+        "x" * 300,
+    ],
+)
+def test_rewrite_future_plan_items_matches_per_row_rewrite(orchestrator: AgentOrchestrator, reflection: str) -> None:
+    with get_session() as session:
+        goal = LearningGoal(title="Learn Rust")
+        session.add(goal)
+        session.commit()
+        items = [
+            PlanItem(goal_id=goal.id, day_number=day, task=f"task {idx}", notes=notes)
+            for idx, (day, notes) in enumerate(
+                [(1, "today"), (2, None), (2, ""), (3, "  keep  "), (3, "x\n")]
+            )
+        ]
+        session.add_all(items)
+        session.commit()
+        expected = {
+            item.id: _rewrite_in_python(item, 1, reflection) if item.day_number > 1 else (item.task, item.notes)
+            for item in items
+        }
+
+        orchestrator._rewrite_future_plan_items(session, goal.id, 1, reflection)
+        session.commit()
+
+        rows = session.exec(select(PlanItem).where(PlanItem.goal_id == goal.id)).all()
+        assert {row.id: (row.task, row.notes) for row in rows} == expected
+
+
+def test_rewrite_future_plan_items_ignores_empty_reflection(orchestrator: AgentOrchestrator) -> None:
+    with get_session() as session:
+        goal = LearningGoal(title="Learn Go")
+        session.add(goal)
+        session.commit()
+        session.add(PlanItem(goal_id=goal.id, day_number=2, task="task", notes="n"))
+        session.commit()
+
+        orchestrator._rewrite_future_plan_items(session, goal.id, 1, "")
+        session.commit()
+
+        row = session.exec(select(PlanItem).where(PlanItem.goal_id == goal.id)).one()
+        assert (row.task, row.notes) == ("task", "n")
@@ -0,0 +1,65 @@
+"""Quiz parsing and grading in the tutor agent."""
+
+from __future__ import annotations
+
+import random
+import re
+
+import pytest
+
+from agent_smith.agents.tutor import TutorAgent
+
+
+def _parse_per_line(raw: str) -> list[dict[str, str]]:
+    """The original line-by-line parser the single-pass regex replaced."""
+
+    entries: list[dict[str, str]] = []
+    pattern = re.compile(r"^(\d+)[\.)\-]*\s*(.+?)\s*Answer[:\-]\s*(.+)$", re.IGNORECASE)
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = pattern.match(line)
+        if match:
+            entries.append(
+                {"question": match.group(2).strip(), "answer": match.group(3).strip(), "difficulty": "medium"}
+            )
+    return entries
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "1. What is X? Answer: Y\n2) Why Z answer - because\n",
+        "1. What is X? Answer: Y\r\n2. What is W? Answer: V\r\n",
+        "1. What is X? Answer:  \n",
+        "1. What is X? Answer:\r\n",
+        "1. q Answer:\t\r\n2) r Answer:b",
+        "  3 - How? ANSWER: so  \r\nnot a question\n4.\n",
+        "1. q\rAnswer: a\n",
+        "",
+    ],
+)
+def test_parse_questions_matches_per_line_parser(raw: str) -> None:
+    assert TutorAgent._parse_questions(raw) == _parse_per_line(raw)
+
+
+def test_parse_questions_skips_empty_answer_keys() -> None:
+    assert TutorAgent._parse_questions("1. What is X? Answer:  \n2. What is Y? Answer:\r\n") == []
+
+
+def test_parse_questions_matches_per_line_parser_on_random_input() -> None:
+    pieces = ["1", ".", "2)", "10-", " ", "  ", "\t", "\r\n", "\n", "\r", "\x0b", "\x1c", "\x1f", "\x85", "\xa0",
+              "q", "What is X?", "Answer:", "answer-", "ANSWER :", "y", "a b", "-", ":"]
+    rng = random.Random(7)
+    for _ in range(5000):
+        raw = "".join(rng.choices(pieces, k=rng.randint(1, 25)))
+        assert TutorAgent._parse_questions(raw) == _parse_per_line(raw), repr(raw)
+
+
+def test_evaluate_answer() -> None:
+    expected = "ownership and borrowing"
+    assert TutorAgent.evaluate_answer(expected, "Borrowing and ownership rules") == (True, "Great job!")
+    is_correct, feedback = TutorAgent.evaluate_answer(expected, "lifetimes")
+    assert not is_correct
+    assert feedback == "Focus on covering: and borrowing ownership"
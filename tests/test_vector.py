@@ -0,0 +1,56 @@
+"""Hashing embedder used for local semantic memory."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+
+import numpy as np
+import pytest
+
+from agent_smith.tools import vector
+
+
+def _embed_reference(texts: list[str], dimensions: int = 64) -> list[list[float]]:
+    """The original per-token Python loop."""
+
+    vectors = []
+    for text in texts:
+        acc = [0.0] * dimensions
+        for token in text.lower().split():
+            digest = hashlib.sha256(token.encode("utf-8")).digest()
+            for idx in range(dimensions):
+                acc[idx] += digest[idx % len(digest)] / 255.0
+        norm = math.sqrt(sum(value * value for value in acc)) or 1.0
+        vectors.append([value / norm for value in acc])
+    return vectors
+
+
+TEXTS = ["hello world", "", "  ", "The THE the", "a\x1cb c", "Ünïcode wörds here", "x " * 50]
+
+
+@pytest.mark.parametrize("dimensions", [8, 64, 100])
+def test_embeddings_match_reference(dimensions: int) -> None:
+    embed = vector.LightweightEmbeddingFunction(dimensions=dimensions)
+    np.testing.assert_allclose(embed(TEXTS), _embed_reference(TEXTS, dimensions), atol=1e-6)
+
+
+def test_quantized_embeddings_stay_close() -> None:
+    exact = np.array(vector.LightweightEmbeddingFunction()(TEXTS))
+    quantized = np.array(vector.LightweightEmbeddingFunction(quantize=True)(TEXTS))
+    np.testing.assert_allclose(quantized, exact, atol=0.5 / 127 + 1e-6)
+
+
+def test_numba_kernel_matches_numpy() -> None:
+    numba = pytest.importorskip("numba")
+    kernel = numba.njit(vector._accumulate_kernel)
+    rng = np.random.default_rng(0)
+    for counts in ([0, 0], [3, 0, 4], [0, 1, 0], [5] * 20):
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.intp)
+        digests = rng.integers(0, 256, size=(offsets[-1], 32), dtype=np.uint8)
+        weights = rng.integers(1, 5, size=offsets[-1]).astype(np.int64)
+        expected = np.empty((len(counts), 64), dtype=np.float32)
+        actual = np.empty_like(expected)
+        vector._accumulate_numpy(digests, weights, offsets, expected)
+        kernel(digests, weights, offsets, actual)
+        np.testing.assert_allclose(actual, expected, atol=1e-6)